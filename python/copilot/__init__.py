@@ -4,7 +4,13 @@ Copilot SDK - Python Client for GitHub Copilot CLI
 JSON-RPC based SDK for programmatic control of GitHub Copilot CLI
 """
 
-from .client import CopilotClient
+from .client import (
+    CopilotClient,
+    InvalidAuthWithCliUrlError,
+    InvalidCliUrlError,
+    InvalidPortError,
+    MutuallyExclusiveOptionsError,
+)
 from .session import CopilotSession
 from .tools import define_tool
 from .types import (
@@ -47,6 +53,9 @@ __all__ = [
     "CustomAgentConfig",
     "GetAuthStatusResponse",
     "GetStatusResponse",
+    "InvalidAuthWithCliUrlError",
+    "InvalidCliUrlError",
+    "InvalidPortError",
     "MCPLocalServerConfig",
     "MCPRemoteServerConfig",
     "MCPServerConfig",
@@ -55,6 +64,7 @@ __all__ = [
     "ModelCapabilities",
     "ModelInfo",
     "ModelPolicy",
+    "MutuallyExclusiveOptionsError",
     "PermissionHandler",
     "PermissionRequest",
     "PermissionRequestResult",
@@ -49,6 +49,22 @@ from .types import (
 )
 
 
+class InvalidCliUrlError(ValueError):
+    """The cli_url option is not in a recognized host:port format"""
+
+
+class InvalidPortError(InvalidCliUrlError):
+    """The port in the cli_url option is not a valid TCP port"""
+
+
+class MutuallyExclusiveOptionsError(ValueError):
+    """cli_url was combined with use_stdio or cli_path"""
+
+
+class InvalidAuthWithCliUrlError(ValueError):
+    """github_token or use_logged_in_user was combined with cli_url"""
+
+
 def _get_bundled_cli_path() -> Optional[str]:
     """Get the path to the bundled CLI binary, if available."""
     # The binary is bundled in copilot/bin/ within the package
@@ -69,6 +85,50 @@ def _get_bundled_cli_path() -> Optional[str]:
     return None
 
 
+def _parse_cli_url(url: str) -> tuple[str, int]:
+    """
+    Parse CLI URL into host and port.
+
+    Supports formats: "host:port", "http://host:port", "https://host:port",
+    or just "port".
+
+    Args:
+        url: The CLI URL to parse.
+
+    Returns:
+        A tuple of (host, port).
+
+    Raises:
+        InvalidCliUrlError: If the URL format is invalid.
+        InvalidPortError: If the port is not a number or is out of range.
+    """
+    # Remove protocol if present
+    clean_url = re.sub(r"^https?://", "", url)
+
+    # Check if it's just a port number
+    if clean_url.isdigit():
+        port = int(clean_url)
+        if port <= 0 or port > 65535:
+            raise InvalidPortError(f"Invalid port in cli_url: {url}")
+        return ("localhost", port)
+
+    # Parse host:port format
+    parts = clean_url.split(":")
+    if len(parts) != 2:
+        raise InvalidCliUrlError(f"Invalid cli_url format: {url}")
+
+    host = parts[0] if parts[0] else "localhost"
+    try:
+        port = int(parts[1])
+    except ValueError as e:
+        raise InvalidPortError(f"Invalid port in cli_url: {url}") from e
+
+    if port <= 0 or port > 65535:
+        raise InvalidPortError(f"Invalid port in cli_url: {url}")
+
+    return (host, port)
+
+
 class CopilotClient:
     """
     Main client for interacting with the Copilot CLI.
@@ -110,8 +170,11 @@ class CopilotClient:
                 default options are used (spawns CLI server using stdio).
 
         Raises:
-            ValueError: If mutually exclusive options are provided (e.g., cli_url
-                with use_stdio or cli_path).
+            MutuallyExclusiveOptionsError: If cli_url is combined with use_stdio or
+                cli_path.
+            InvalidAuthWithCliUrlError: If cli_url is combined with github_token or
+                use_logged_in_user.
+            InvalidCliUrlError: If cli_url cannot be parsed.
 
         Example:
             >>> # Default options - spawns CLI server using stdio
@@ -130,13 +193,15 @@ class CopilotClient:
 
         # Validate mutually exclusive options
         if opts.get("cli_url") and (opts.get("use_stdio") or opts.get("cli_path")):
-            raise ValueError("cli_url is mutually exclusive with use_stdio and cli_path")
+            raise MutuallyExclusiveOptionsError(
+                "cli_url is mutually exclusive with use_stdio and cli_path"
+            )
 
         # Validate auth options with external server
         if opts.get("cli_url") and (
             opts.get("github_token") or opts.get("use_logged_in_user") is not None
         ):
-            raise ValueError(
+            raise InvalidAuthWithCliUrlError(
                 "github_token and use_logged_in_user cannot be used with cli_url "
                 "(external server manages its own auth)"
             )
@@ -145,7 +210,7 @@ class CopilotClient:
         self._actual_host: str = "localhost"
         self._is_external_server: bool = False
         if opts.get("cli_url"):
-            self._actual_host, actual_port = self._parse_cli_url(opts["cli_url"])
+            self._actual_host, actual_port = _parse_cli_url(opts["cli_url"])
             self._actual_port: Optional[int] = actual_port
             self._is_external_server = True
         else:
@@ -203,50 +268,6 @@ class CopilotClient:
         ] = {}
         self._lifecycle_handlers_lock = threading.Lock()
 
-    def _parse_cli_url(self, url: str) -> tuple[str, int]:
-        """
-        Parse CLI URL into host and port.
-
-        Supports formats: "host:port", "http://host:port", "https://host:port",
-        or just "port".
-
-        Args:
-            url: The CLI URL to parse.
-
-        Returns:
-            A tuple of (host, port).
-
-        Raises:
-            ValueError: If the URL format is invalid or the port is out of range.
-        """
-        import re
-
-        # Remove protocol if present
-        clean_url = re.sub(r"^https?://", "", url)
-
-        # Check if it's just a port number
-        if clean_url.isdigit():
-            port = int(clean_url)
-            if port <= 0 or port > 65535:
-                raise ValueError(f"Invalid port in cli_url: {url}")
-            return ("localhost", port)
-
-        # Parse host:port format
-        parts = clean_url.split(":")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid cli_url format: {url}")
-
-        host = parts[0] if parts[0] else "localhost"
-        try:
-            port = int(parts[1])
-        except ValueError as e:
-            raise ValueError(f"Invalid port in cli_url: {url}") from e
-
-        if port <= 0 or port > 65535:
-            raise ValueError(f"Invalid port in cli_url: {url}")
-
-        return (host, port)
-
     async def start(self) -> None:
         """
         Start the CLI server and establish a connection.
@@ -1004,13 +1025,19 @@ class CopilotClient:
             else:
                 raise ValueError("Invalid arguments: use on(handler) or on(event_type, handler)")
 
-    def _dispatch_lifecycle_event(self, event: SessionLifecycleEvent) -> None:
-        """Dispatch a lifecycle event to all registered handlers."""
+    def _dispatch_lifecycle_event(self, params: dict) -> None:
+        """Dispatch a session.lifecycle notification to all registered handlers."""
+        event_type = params.get("type", "session.updated")
         with self._lifecycle_handlers_lock:
             # Copy handlers to avoid holding lock during callbacks
-            typed_handlers = list(self._typed_lifecycle_handlers.get(event.type, []))
+            typed_handlers = list(self._typed_lifecycle_handlers.get(event_type, []))
             wildcard_handlers = list(self._lifecycle_handlers)
 
+        # Most clients never subscribe, so only build the event when someone is listening
+        if not typed_handlers and not wildcard_handlers:
+            return
+        event = SessionLifecycleEvent.from_dict(params)
+
         # Dispatch to typed handlers
         for handler in typed_handlers:
             try:
@@ -1237,8 +1264,7 @@ class CopilotClient:
                     session._dispatch_event(event)
             elif method == "session.lifecycle":
                 # Handle session lifecycle events
-                lifecycle_event = SessionLifecycleEvent.from_dict(params)
-                self._dispatch_lifecycle_event(lifecycle_event)
+                self._dispatch_lifecycle_event(params)
 
         self._client.set_notification_handler(handle_notification)
         self._client.set_request_handler("tool.call", self._handle_tool_call_request)
@@ -1317,8 +1343,7 @@ class CopilotClient:
                     session._dispatch_event(event)
             elif method == "session.lifecycle":
                 # Handle session lifecycle events
-                lifecycle_event = SessionLifecycleEvent.from_dict(params)
-                self._dispatch_lifecycle_event(lifecycle_event)
+                self._dispatch_lifecycle_event(params)
 
         self._client.set_notification_handler(handle_notification)
         self._client.set_request_handler("tool.call", self._handle_tool_call_request)
@@ -7,9 +7,9 @@ Much simpler and more reliable than pure asyncio subprocess.
 
 import asyncio
 import inspect
+import itertools
 import json
 import threading
-import uuid
 from collections.abc import Awaitable
 from typing import Any, Callable, Optional, Union
 
@@ -43,6 +43,7 @@ class JsonRpcClient:
         """
         self.process = process
         self.pending_requests: dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
         self.notification_handler: Optional[Callable[[str, dict], None]] = None
         self.request_handlers: dict[str, RequestHandler] = {}
         self._running = False
@@ -84,7 +85,8 @@ class JsonRpcClient:
             JsonRpcError: If server returns an error
             asyncio.TimeoutError: If request times out
         """
-        request_id = str(uuid.uuid4())
+        # Ids only need to be unique per connection, so a counter is enough
+        request_id = str(next(self._request_ids))
 
         # Use the stored loop to ensure consistency with the reader thread
         if not self._loop:
@@ -139,12 +141,11 @@ class JsonRpcClient:
         loop = self._loop or asyncio.get_event_loop()
 
         def write():
-            content = json.dumps(message, separators=(",", ":"))
-            content_bytes = content.encode("utf-8")
-            header = f"Content-Length: {len(content_bytes)}\r\n\r\n"
+            content_bytes = json.dumps(message, separators=(",", ":")).encode("utf-8")
+            # Send header and body in a single write so each frame is one syscall
+            frame = b"Content-Length: %d\r\n\r\n%b" % (len(content_bytes), content_bytes)
             with self._write_lock:
-                self.process.stdin.write(header.encode("utf-8"))
-                self.process.stdin.write(content_bytes)
+                self.process.stdin.write(frame)
                 self.process.stdin.flush()
 
         # Run in thread pool to avoid blocking
@@ -196,26 +197,26 @@ class JsonRpcClient:
         if not header_line:
             return None
 
-        # Parse Content-Length
-        header = header_line.decode("utf-8").strip()
-        if not header.startswith("Content-Length:"):
+        # Parse Content-Length directly from the header bytes
+        header = header_line.strip()
+        if not header.startswith(b"Content-Length:"):
             return None
 
-        content_length = int(header.split(":")[1].strip())
+        content_length = int(header.split(b":", 1)[1])
 
         # Read empty line
         self.process.stdout.readline()
 
         # Read exact content using loop to handle short reads
         content_bytes = self._read_exact(content_length)
-        content = content_bytes.decode("utf-8")
 
-        return json.loads(content)
+        # json.loads detects UTF-8 itself, so skip the intermediate str copy
+        return json.loads(content_bytes)
 
     def _handle_message(self, message: dict):
         """Handle an incoming message (response or notification)"""
-        # Check if it's a response to our request
-        if "id" in message:
+        # Check if it's a response to our request (incoming requests also carry an id)
+        if "id" in message and "method" not in message:
             with self._pending_lock:
                 future = self.pending_requests.get(message["id"])
 
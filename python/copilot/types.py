@@ -455,12 +455,12 @@ class InfiniteSessionConfig(TypedDict, total=False):
     buffer_exhaustion_threshold: float
 
 
-# Configuration for creating a session
-class SessionConfig(TypedDict, total=False):
-    """Configuration for creating a session"""
+class _SessionConfigCommon(TypedDict, total=False):
+    """Options shared by SessionConfig and ResumeSessionConfig"""
 
-    session_id: str  # Optional custom session ID
-    model: str  # Model to use for this session. Use client.list_models() to see available models.
+    # Model to use for this session. Use client.list_models() to see available models.
+    # When resuming, this can change the model of the existing session.
+    model: str
     # Reasoning effort level for models that support it.
     # Only valid for models where capabilities.supports.reasoning_effort is True.
     reasoning_effort: ReasoningEffort
@@ -501,6 +501,13 @@ class SessionConfig(TypedDict, total=False):
     infinite_sessions: InfiniteSessionConfig
 
 
+# Configuration for creating a session
+class SessionConfig(_SessionConfigCommon, total=False):
+    """Configuration for creating a session"""
+
+    session_id: str  # Optional custom session ID
+
+
 # Azure-specific provider options
 class AzureProviderOptions(TypedDict, total=False):
     """Azure-specific provider configuration"""
@@ -524,41 +531,9 @@ class ProviderConfig(TypedDict, total=False):
 
 
 # Configuration for resuming a session
-class ResumeSessionConfig(TypedDict, total=False):
+class ResumeSessionConfig(_SessionConfigCommon, total=False):
     """Configuration for resuming a session"""
 
-    # Model to use for this session. Can change the model when resuming.
-    model: str
-    tools: list[Tool]
-    system_message: SystemMessageConfig  # System message configuration
-    # List of tool names to allow (takes precedence over excluded_tools)
-    available_tools: list[str]
-    # List of tool names to disable (ignored if available_tools is set)
-    excluded_tools: list[str]
-    provider: ProviderConfig
-    # Reasoning effort level for models that support it.
-    reasoning_effort: ReasoningEffort
-    on_permission_request: PermissionHandler
-    # Handler for user input requests from the agent (enables ask_user tool)
-    on_user_input_request: UserInputHandler
-    # Hook handlers for intercepting session lifecycle events
-    hooks: SessionHooks
-    # Working directory for the session. Tool operations will be relative to this directory.
-    working_directory: str
-    # Override the default configuration directory location.
-    config_dir: str
-    # Enable streaming of assistant message chunks
-    streaming: bool
-    # MCP server configurations for the session
-    mcp_servers: dict[str, MCPServerConfig]
-    # Custom agent configurations for the session
-    custom_agents: list[CustomAgentConfig]
-    # Directories to load skills from
-    skill_directories: list[str]
-    # List of skill names to disable
-    disabled_skills: list[str]
-    # Infinite session configuration for persistent workspaces and automatic compaction.
-    infinite_sessions: InfiniteSessionConfig
     # When True, skips emitting the session.resume event.
     # Useful for reconnecting to a session without triggering resume-related side effects.
     disable_resume: bool
@@ -584,6 +559,8 @@ SessionEventHandler = Callable[[SessionEvent], None]
 class PingResponse:
     """Response from ping"""
 
+    __slots__ = ("message", "timestamp", "protocolVersion")
+
     message: str  # Echo message with "pong: " prefix
     timestamp: int  # Server timestamp in milliseconds
     protocolVersion: int  # Protocol version for SDK compatibility
@@ -614,6 +591,8 @@ class PingResponse:
 class StopError:
     """Error information from client stop"""
 
+    __slots__ = ("message",)
+
     message: str  # Error message describing what failed during cleanup
 
     @staticmethod
@@ -635,6 +614,8 @@ class StopError:
 class GetStatusResponse:
     """Response from status.get"""
 
+    __slots__ = ("version", "protocolVersion")
+
     version: str  # Package version (e.g., "1.0.0")
     protocolVersion: int  # Protocol version for SDK compatibility
 
@@ -791,6 +772,8 @@ class ModelSupports:
 class ModelCapabilities:
     """Model capabilities and limits"""
 
+    __slots__ = ("supports", "limits")
+
     supports: ModelSupports
     limits: ModelLimits
 
@@ -819,6 +802,8 @@ class ModelCapabilities:
 class ModelPolicy:
     """Model policy state"""
 
+    __slots__ = ("state", "terms")
+
     state: str  # "enabled", "disabled", or "unconfigured"
     terms: str
 
@@ -844,6 +829,8 @@ class ModelPolicy:
 class ModelBilling:
     """Model billing information"""
 
+    __slots__ = ("multiplier",)
+
     multiplier: float
 
     @staticmethod
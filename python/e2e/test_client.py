@@ -1,12 +1,27 @@
 """E2E Client Tests"""
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 
 from copilot import CopilotClient
 
 from .testharness import CLI_PATH
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_client():
+    """A started client shared by tests that only issue read-only requests."""
+    client = CopilotClient({"cli_path": CLI_PATH, "use_stdio": True})
+    await client.start()
+    yield client
+    try:
+        await client.stop()
+    finally:
+        await client.force_stop()
+
+
 class TestClient:
     @pytest.mark.asyncio
     async def test_should_start_and_connect_to_server_using_stdio(self):
@@ -46,8 +61,6 @@ class TestClient:
 
     @pytest.mark.asyncio
     async def test_should_return_errors_on_failed_cleanup(self):
-        import asyncio
-
         client = CopilotClient({"cli_path": CLI_PATH})
 
         try:
@@ -73,68 +86,49 @@ class TestClient:
         await client.force_stop()
         assert client.get_state() == "disconnected"
 
-    @pytest.mark.asyncio
-    async def test_should_get_status_with_version_and_protocol_info(self):
-        client = CopilotClient({"cli_path": CLI_PATH, "use_stdio": True})
-
-        try:
-            await client.start()
-
-            status = await client.get_status()
-            assert hasattr(status, "version")
-            assert isinstance(status.version, str)
-            assert hasattr(status, "protocolVersion")
-            assert isinstance(status.protocolVersion, int)
-            assert status.protocolVersion >= 1
-
-            await client.stop()
-        finally:
-            await client.force_stop()
-
-    @pytest.mark.asyncio
-    async def test_should_get_auth_status(self):
-        client = CopilotClient({"cli_path": CLI_PATH, "use_stdio": True})
-
-        try:
-            await client.start()
-
-            auth_status = await client.get_auth_status()
-            assert hasattr(auth_status, "isAuthenticated")
-            assert isinstance(auth_status.isAuthenticated, bool)
-            if auth_status.isAuthenticated:
-                assert hasattr(auth_status, "authType")
-                assert hasattr(auth_status, "statusMessage")
-
-            await client.stop()
-        finally:
-            await client.force_stop()
-
-    @pytest.mark.asyncio
-    async def test_should_list_models_when_authenticated(self):
-        client = CopilotClient({"cli_path": CLI_PATH, "use_stdio": True})
-
-        try:
-            await client.start()
-
-            auth_status = await client.get_auth_status()
-            if not auth_status.isAuthenticated:
-                # Skip if not authenticated - models.list requires auth
-                await client.stop()
-                return
-
-            models = await client.list_models()
-            assert isinstance(models, list)
-            if len(models) > 0:
-                model = models[0]
-                assert hasattr(model, "id")
-                assert hasattr(model, "name")
-                assert hasattr(model, "capabilities")
-                assert hasattr(model.capabilities, "supports")
-                assert hasattr(model.capabilities, "limits")
-
-            await client.stop()
-        finally:
-            await client.force_stop()
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_should_get_status_with_version_and_protocol_info(
+        self, shared_client: CopilotClient
+    ):
+        status = await shared_client.get_status()
+        assert hasattr(status, "version")
+        assert isinstance(status.version, str)
+        assert hasattr(status, "protocolVersion")
+        assert isinstance(status.protocolVersion, int)
+        assert status.protocolVersion >= 1
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_should_handle_concurrent_requests(self, shared_client: CopilotClient):
+        # Several requests in flight at once must each be matched to their own response
+        messages = [f"message {i}" for i in range(10)]
+        pongs = await asyncio.gather(*(shared_client.ping(message) for message in messages))
+        assert [pong.message for pong in pongs] == [f"pong: {message}" for message in messages]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_should_get_auth_status(self, shared_client: CopilotClient):
+        auth_status = await shared_client.get_auth_status()
+        assert hasattr(auth_status, "isAuthenticated")
+        assert isinstance(auth_status.isAuthenticated, bool)
+        if auth_status.isAuthenticated:
+            assert hasattr(auth_status, "authType")
+            assert hasattr(auth_status, "statusMessage")
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_should_list_models_when_authenticated(self, shared_client: CopilotClient):
+        auth_status = await shared_client.get_auth_status()
+        if not auth_status.isAuthenticated:
+            # Skip if not authenticated - models.list requires auth
+            return
+
+        models = await shared_client.list_models()
+        assert isinstance(models, list)
+        if len(models) > 0:
+            model = models[0]
+            assert hasattr(model, "id")
+            assert hasattr(model, "name")
+            assert hasattr(model, "capabilities")
+            assert hasattr(model.capabilities, "supports")
+            assert hasattr(model.capabilities, "limits")
 
     @pytest.mark.asyncio
     async def test_should_cache_models_list(self):
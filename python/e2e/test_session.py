@@ -1,16 +1,23 @@
 """E2E Session Tests"""
 
-import os
+import io
 
 import pytest
 
-from copilot import CopilotClient
 from copilot.types import Tool
 
-from .testharness import E2ETestContext, get_final_assistant_message, get_next_event_of_type
+from .testharness import (
+    E2ETestContext,
+    get_final_assistant_message,
+    get_next_event_of_type,
+    wait_for_session_in_list,
+)
 
 pytestmark = pytest.mark.asyncio(loop_scope="module")
 
+# Event types the streaming test reacts to; everything else is skipped early
+_STREAMING_EVENT_TYPES = frozenset({"assistant.message_delta", "session.idle"})
+
 
 class TestSessions:
     async def test_should_create_and_destroy_sessions(self, ctx: E2ETestContext):
@@ -86,9 +93,8 @@ class TestSessions:
 
         # It only tells the model about the specified tools and no others
         traffic = await ctx.get_exchanges()
-        tools = traffic[0]["request"]["tools"]
-        tool_names = [t["function"]["name"] for t in tools]
-        assert len(tool_names) == 2
+        assert len(traffic[0]["request"]["tools"]) == 2
+        tool_names = _get_tool_names(traffic[0])
         assert "view" in tool_names
         assert "edit" in tool_names
 
@@ -100,8 +106,7 @@ class TestSessions:
 
         # It has other tools, but not the one we excluded
         traffic = await ctx.get_exchanges()
-        tools = traffic[0]["request"]["tools"]
-        tool_names = [t["function"]["name"] for t in tools]
+        tool_names = _get_tool_names(traffic[0])
         assert "edit" in tool_names
         assert "grep" in tool_names
         assert "view" not in tool_names
@@ -159,30 +164,17 @@ class TestSessions:
         assert answer is not None
         assert "2" in answer.data.content
 
-        # Resume using a new client
-        github_token = "fake-token-for-e2e-tests" if os.environ.get("CI") == "true" else None
-        new_client = CopilotClient(
-            {
-                "cli_path": ctx.cli_path,
-                "cwd": ctx.work_dir,
-                "env": ctx.get_env(),
-                "github_token": github_token,
-            }
-        )
+        # Resume using a different client
+        session2 = await ctx.alt_client.resume_session(session_id)
+        assert session2.session_id == session_id
 
-        try:
-            session2 = await new_client.resume_session(session_id)
-            assert session2.session_id == session_id
-
-            # TODO: There's an inconsistency here. When resuming with a new client,
-            # we don't see the session.idle message in the history, which means we
-            # can't use get_final_assistant_message.
-            messages = await session2.get_messages()
-            message_types = [m.type.value for m in messages]
-            assert "user.message" in message_types
-            assert "session.resume" in message_types
-        finally:
-            await new_client.force_stop()
+        # TODO: There's an inconsistency here. When resuming with a new client,
+        # we don't see the session.idle message in the history, which means we
+        # can't use get_final_assistant_message.
+        messages = await session2.get_messages()
+        message_types = [m.type.value for m in messages]
+        assert "user.message" in message_types
+        assert "session.resume" in message_types
 
     async def test_should_throw_error_resuming_nonexistent_session(self, ctx: E2ETestContext):
         with pytest.raises(Exception):
@@ -191,20 +183,25 @@ class TestSessions:
     async def test_should_list_sessions(self, ctx: E2ETestContext):
         import asyncio
 
-        # Create a couple of sessions and send messages to persist them
+        # Create a couple of sessions and send messages to persist them.
+        # Sessions are created one at a time (see the concurrent sessions test above),
+        # but the two turns are independent and can run together.
         session1 = await ctx.client.create_session()
-        await session1.send_and_wait({"prompt": "Say hello"})
         session2 = await ctx.client.create_session()
-        await session2.send_and_wait({"prompt": "Say goodbye"})
+        await asyncio.gather(
+            session1.send_and_wait({"prompt": "Say hello"}),
+            session2.send_and_wait({"prompt": "Say goodbye"}),
+        )
 
-        # Small delay to ensure session files are written to disk
-        await asyncio.sleep(0.2)
+        # Wait until the session files have been written to disk
+        await wait_for_session_in_list(ctx.client, session1.session_id)
+        await wait_for_session_in_list(ctx.client, session2.session_id)
 
         # List sessions and verify they're included
         sessions = await ctx.client.list_sessions()
         assert isinstance(sessions, list)
 
-        session_ids = [s.sessionId for s in sessions]
+        session_ids = {s.sessionId for s in sessions}
         assert session1.session_id in session_ids
         assert session2.session_id in session_ids
 
@@ -221,19 +218,17 @@ class TestSessions:
             assert isinstance(session_data.isRemote, bool)
 
     async def test_should_delete_session(self, ctx: E2ETestContext):
-        import asyncio
-
         # Create a session and send a message to persist it
         session = await ctx.client.create_session()
         await session.send_and_wait({"prompt": "Hello"})
         session_id = session.session_id
 
-        # Small delay to ensure session file is written to disk
-        await asyncio.sleep(0.2)
+        # Wait until the session file has been written to disk
+        await wait_for_session_in_list(ctx.client, session_id)
 
         # Verify session exists in the list
         sessions = await ctx.client.list_sessions()
-        session_ids = [s.sessionId for s in sessions]
+        session_ids = {s.sessionId for s in sessions}
         assert session_id in session_ids
 
         # Delete the session
@@ -241,7 +236,7 @@ class TestSessions:
 
         # Verify session no longer exists in the list
         sessions_after = await ctx.client.list_sessions()
-        session_ids_after = [s.sessionId for s in sessions_after]
+        session_ids_after = {s.sessionId for s in sessions_after}
         assert session_id not in session_ids_after
 
         # Verify we cannot resume the deleted session
@@ -336,24 +331,30 @@ class TestSessions:
             get_next_event_of_type(session, "session.idle", timeout=30.0)
         )
 
-        # Send a message that will trigger a long-running shell command
-        await session.send(
-            {
-                "prompt": (
-                    "run the shell command 'sleep 100' "
-                    "(note this works on both bash and PowerShell)"
-                )
-            }
-        )
+        try:
+            # Send a message that will trigger a long-running shell command
+            await session.send(
+                {
+                    "prompt": (
+                        "run the shell command 'sleep 100' "
+                        "(note this works on both bash and PowerShell)"
+                    )
+                }
+            )
 
-        # Wait for the tool to start executing
-        _ = await wait_for_tool_start
+            # Wait for the tool to start executing
+            _ = await wait_for_tool_start
 
-        # Abort the session while the tool is running
-        await session.abort()
+            # Abort the session while the tool is running
+            await session.abort()
 
-        # Wait for session to become idle after abort
-        _ = await wait_for_session_idle
+            # Wait for session to become idle after abort
+            _ = await wait_for_session_idle
+        finally:
+            # Don't leave a listener task running into later tests if anything above failed
+            for task in (wait_for_tool_start, wait_for_session_idle):
+                if not task.done():
+                    task.cancel()
 
         # The session should still be alive and usable after abort
         messages = await session.get_messages()
@@ -374,15 +375,18 @@ class TestSessions:
 
         session = await ctx.client.create_session({"streaming": True})
 
-        delta_contents = []
+        delta_buffer = io.StringIO()
         done_event = asyncio.Event()
 
         def on_event(event):
-            if event.type.value == "assistant.message_delta":
+            event_type = event.type.value
+            if event_type not in _STREAMING_EVENT_TYPES:
+                return
+            if event_type == "assistant.message_delta":
                 delta = getattr(event.data, "delta_content", None)
                 if delta:
-                    delta_contents.append(delta)
-            elif event.type.value == "session.idle":
+                    delta_buffer.write(delta)
+            elif event_type == "session.idle":
                 done_event.set()
 
         session.on(on_event)
@@ -395,14 +399,14 @@ class TestSessions:
         except asyncio.TimeoutError:
             pytest.fail("Timed out waiting for session.idle")
 
-        # Should have received delta events
-        assert len(delta_contents) > 0, "Expected to receive delta events"
+        # Should have received delta events (only non-empty deltas are written)
+        assert delta_buffer.tell() > 0, "Expected to receive delta events"
 
         # Get the final message to compare
         assistant_message = await get_final_assistant_message(session)
 
         # Accumulated deltas should equal the final message
-        accumulated = "".join(delta_contents)
+        accumulated = delta_buffer.getvalue()
         assert accumulated == assistant_message.data.content, (
             f"Accumulated deltas don't match final message.\n"
             f"Accumulated: {accumulated!r}\nFinal: {assistant_message.data.content!r}"
@@ -476,3 +480,7 @@ def _get_system_message(exchange: dict) -> str:
         if msg.get("role") == "system":
             return msg.get("content", "")
     return ""
+
+
+def _get_tool_names(exchange: dict) -> frozenset:
+    return frozenset(t["function"]["name"] for t in exchange["request"]["tools"])
@@ -49,6 +49,7 @@ class TestDefineTool:
         assert "unit" in schema["properties"]
         assert schema["properties"]["city"]["description"] == "City name"
 
+    @pytest.mark.asyncio
     async def test_handler_receives_typed_arguments(self):
         class Params(BaseModel):
             name: str
@@ -75,6 +76,7 @@ class TestDefineTool:
         assert received_params.name == "Alice"
         assert received_params.count == 42
 
+    @pytest.mark.asyncio
     async def test_handler_receives_invocation(self):
         class Params(BaseModel):
             pass
@@ -99,6 +101,7 @@ class TestDefineTool:
         assert received_inv["session_id"] == "session-123"
         assert received_inv["tool_call_id"] == "call-456"
 
+    @pytest.mark.asyncio
     async def test_zero_param_handler(self):
         """Handler with no parameters: def handler() -> str"""
         called = False
@@ -121,6 +124,7 @@ class TestDefineTool:
         assert called
         assert result["textResultForLlm"] == "ok"
 
+    @pytest.mark.asyncio
     async def test_invocation_only_handler(self):
         """Handler with only invocation: def handler(invocation) -> str"""
         received_inv = None
@@ -143,6 +147,7 @@ class TestDefineTool:
         assert received_inv is not None
         assert received_inv["session_id"] == "s1"
 
+    @pytest.mark.asyncio
     async def test_params_only_handler(self):
         """Handler with only params: def handler(params) -> str"""
 
@@ -169,6 +174,7 @@ class TestDefineTool:
         assert received_params is not None
         assert received_params.value == "hello"
 
+    @pytest.mark.asyncio
     async def test_handler_error_is_hidden_from_llm(self):
         class Params(BaseModel):
             pass
@@ -192,6 +198,7 @@ class TestDefineTool:
         # But the actual error is stored internally
         assert result["error"] == "secret error message"
 
+    @pytest.mark.asyncio
     async def test_function_style_api(self):
         class Params(BaseModel):
             value: str
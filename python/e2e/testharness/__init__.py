@@ -1,7 +1,11 @@
 """Test harness for E2E tests."""
 
 from .context import CLI_PATH, E2ETestContext
-from .helper import get_final_assistant_message, get_next_event_of_type
+from .helper import (
+    get_final_assistant_message,
+    get_next_event_of_type,
+    wait_for_session_in_list,
+)
 from .proxy import CapiProxy
 
 __all__ = [
@@ -10,4 +14,5 @@ __all__ = [
     "CapiProxy",
     "get_final_assistant_message",
     "get_next_event_of_type",
+    "wait_for_session_in_list",
 ]
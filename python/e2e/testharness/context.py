@@ -4,6 +4,7 @@ Test context for E2E tests.
 Provides isolated directories and a replaying proxy for testing the SDK.
 """
 
+import asyncio
 import os
 import re
 import shutil
@@ -30,6 +31,9 @@ def get_cli_path_for_tests() -> str:
 CLI_PATH = get_cli_path_for_tests()
 SNAPSHOTS_DIR = Path(__file__).parents[3] / "test" / "snapshots"
 
+# Characters replaced with "_" when turning a test name into a snapshot file name
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9]")
+
 
 class E2ETestContext:
     """Holds shared resources for E2E tests."""
@@ -41,10 +45,11 @@ class E2ETestContext:
         self.proxy_url: str = ""
         self._proxy: Optional[CapiProxy] = None
         self._client: Optional[CopilotClient] = None
+        self._alt_client: Optional[CopilotClient] = None
 
     async def setup(self):
         """Set up the test context with a shared client."""
-        self.cli_path = get_cli_path_for_tests()
+        self.cli_path = CLI_PATH
 
         self.home_dir = tempfile.mkdtemp(prefix="copilot-test-config-")
         self.work_dir = tempfile.mkdtemp(prefix="copilot-test-work-")
@@ -53,9 +58,15 @@ class E2ETestContext:
         self.proxy_url = await self._proxy.start()
 
         # Create the shared client (like Node.js/Go do)
+        self._client = self._create_client()
+        # A second client for cross-client scenarios; its CLI only starts on first use
+        self._alt_client = self._create_client()
+
+    def _create_client(self) -> CopilotClient:
+        """Create a client that talks to this context's proxy and directories."""
         # Use fake token in CI to allow cached responses without real auth
         github_token = "fake-token-for-e2e-tests" if os.environ.get("CI") == "true" else None
-        self._client = CopilotClient(
+        return CopilotClient(
             {
                 "cli_path": self.cli_path,
                 "cwd": self.work_dir,
@@ -70,6 +81,10 @@ class E2ETestContext:
         Args:
             test_failed: If True, skip writing snapshots to avoid corruption.
         """
+        if self._alt_client:
+            await self._alt_client.stop()
+            self._alt_client = None
+
         if self._client:
             await self._client.stop()
             self._client = None
@@ -78,11 +93,14 @@ class E2ETestContext:
             await self._proxy.stop(skip_writing_cache=test_failed)
             self._proxy = None
 
-        if self.home_dir and os.path.exists(self.home_dir):
-            shutil.rmtree(self.home_dir, ignore_errors=True)
-
-        if self.work_dir and os.path.exists(self.work_dir):
-            shutil.rmtree(self.work_dir, ignore_errors=True)
+        # The two temp directories are independent, so remove them in parallel
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+                for path in (self.home_dir, self.work_dir)
+                if path and os.path.exists(path)
+            )
+        )
 
     async def configure_for_test(self, test_file: str, test_name: str):
         """
@@ -92,26 +110,29 @@ class E2ETestContext:
             test_file: The test file name (e.g., "session" from "test_session.py")
             test_name: The test name (e.g., "should_have_stateful_conversation")
         """
-        sanitized_name = re.sub(r"[^a-zA-Z0-9]", "_", test_name).lower()
+        sanitized_name = _SANITIZE_RE.sub("_", test_name).lower()
         snapshot_path = SNAPSHOTS_DIR / test_file / f"{sanitized_name}.yaml"
         abs_snapshot_path = str(snapshot_path.resolve())
 
         if self._proxy:
             await self._proxy.configure(abs_snapshot_path, self.work_dir)
 
-        # Clear temp directories between tests (but leave them in place)
+        # Clear temp directories between tests
         # Use ignore_errors=True to handle race conditions where files may still
         # be written by background processes during cleanup
-        for item in Path(self.home_dir).iterdir():
-            if item.is_dir():
-                shutil.rmtree(item, ignore_errors=True)
-            else:
-                item.unlink(missing_ok=True)
-        for item in Path(self.work_dir).iterdir():
-            if item.is_dir():
-                shutil.rmtree(item, ignore_errors=True)
-            else:
-                item.unlink(missing_ok=True)
+        # The CLI only reaches home_dir through XDG_* paths, so it can be recreated in one go
+        shutil.rmtree(self.home_dir, ignore_errors=True)
+        os.makedirs(self.home_dir, exist_ok=True)
+        # work_dir is the CLI process's cwd, so empty it but leave it in place
+        with os.scandir(self.work_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
 
     def get_env(self) -> dict:
         """Return environment variables configured for isolated testing."""
@@ -133,6 +154,13 @@ class E2ETestContext:
             raise RuntimeError("Context not set up. Call setup() first.")
         return self._client
 
+    @property
+    def alt_client(self) -> CopilotClient:
+        """Return a second CopilotClient sharing the same proxy and directories."""
+        if not self._alt_client:
+            raise RuntimeError("Context not set up. Call setup() first.")
+        return self._alt_client
+
     async def get_exchanges(self):
         """Retrieve the captured HTTP exchanges from the proxy."""
         if not self._proxy:
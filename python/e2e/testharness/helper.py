@@ -5,7 +5,10 @@ Test helper functions for E2E tests.
 import asyncio
 import os
 
-from copilot import CopilotSession
+from copilot import CopilotClient, CopilotSession
+
+# Event types get_final_assistant_message reacts to; everything else is skipped early
+_FINAL_MESSAGE_EVENT_TYPES = frozenset({"assistant.message", "session.idle", "session.error"})
 
 
 async def get_final_assistant_message(session: CopilotSession, timeout: float = 10.0):
@@ -23,7 +26,7 @@ async def get_final_assistant_message(session: CopilotSession, timeout: float =
         TimeoutError: If no message arrives within timeout
         RuntimeError: If a session error occurs
     """
-    result_future: asyncio.Future = asyncio.get_event_loop().create_future()
+    result_future: asyncio.Future = asyncio.get_running_loop().create_future()
 
     final_assistant_message = None
 
@@ -32,12 +35,15 @@ async def get_final_assistant_message(session: CopilotSession, timeout: float =
         if result_future.done():
             return
 
-        if event.type.value == "assistant.message":
+        event_type = event.type.value
+        if event_type not in _FINAL_MESSAGE_EVENT_TYPES:
+            return
+        if event_type == "assistant.message":
             final_assistant_message = event
-        elif event.type.value == "session.idle":
+        elif event_type == "session.idle":
             if final_assistant_message is not None:
                 result_future.set_result(final_assistant_message)
-        elif event.type.value == "session.error":
+        elif event_type == "session.error":
             msg = event.data.message if event.data.message else "session error"
             result_future.set_exception(RuntimeError(msg))
 
@@ -59,38 +65,30 @@ async def _get_existing_final_response(session: CopilotSession):
     """Check existing messages for a final response."""
     messages = await session.get_messages()
 
-    # Find last user message
-    final_user_message_index = -1
+    # Walk the current turn backwards from the end, stopping at the last user message.
+    # Because this goes in reverse, the values left at the end of the loop belong to
+    # the earliest session.error / session.idle in the turn.
+    error_message = None
+    idle_seen = False
+    assistant_message = None
     for i in range(len(messages) - 1, -1, -1):
-        if messages[i].type.value == "user.message":
-            final_user_message_index = i
-            break
-
-    if final_user_message_index < 0:
-        current_turn_messages = messages
-    else:
-        current_turn_messages = messages[final_user_message_index:]
-
-    # Check for errors
-    for msg in current_turn_messages:
-        if msg.type.value == "session.error":
-            err_msg = msg.data.message if msg.data.message else "session error"
-            raise RuntimeError(err_msg)
-
-    # Find session.idle and get last assistant message before it
-    session_idle_index = -1
-    for i, msg in enumerate(current_turn_messages):
-        if msg.type.value == "session.idle":
-            session_idle_index = i
+        msg = messages[i]
+        msg_type = msg.type.value
+        if msg_type == "user.message":
             break
+        if msg_type == "session.error":
+            error_message = msg.data.message if msg.data.message else "session error"
+        elif msg_type == "session.idle":
+            # Look for the last assistant.message before this (earlier) idle
+            idle_seen = True
+            assistant_message = None
+        elif msg_type == "assistant.message" and idle_seen and assistant_message is None:
+            assistant_message = msg
 
-    if session_idle_index != -1:
-        # Find last assistant.message before session.idle
-        for i in range(session_idle_index - 1, -1, -1):
-            if current_turn_messages[i].type.value == "assistant.message":
-                return current_turn_messages[i]
+    if error_message is not None:
+        raise RuntimeError(error_message)
 
-    return None
+    return assistant_message
 
 
 def write_file(work_dir: str, filename: str, content: str) -> str:
@@ -143,15 +141,16 @@ async def get_next_event_of_type(session: CopilotSession, event_type: str, timeo
         TimeoutError: If no matching event arrives within timeout
         RuntimeError: If a session error occurs
     """
-    result_future: asyncio.Future = asyncio.get_event_loop().create_future()
+    result_future: asyncio.Future = asyncio.get_running_loop().create_future()
 
     def on_event(event):
         if result_future.done():
             return
 
-        if event.type.value == event_type:
+        current_type = event.type.value
+        if current_type == event_type:
             result_future.set_result(event)
-        elif event.type.value == "session.error":
+        elif current_type == "session.error":
             msg = event.data.message if event.data.message else "session error"
             result_future.set_exception(RuntimeError(msg))
 
@@ -161,3 +160,31 @@ async def get_next_event_of_type(session: CopilotSession, event_type: str, timeo
         return await asyncio.wait_for(result_future, timeout=timeout)
     finally:
         unsubscribe()
+
+
+async def wait_for_session_in_list(
+    client: CopilotClient, session_id: str, timeout: float = 2.0
+) -> None:
+    """
+    Wait until a session shows up in the client's session list.
+
+    Session files are written asynchronously after a turn completes, so polling
+    avoids both a fixed sleep and flakes when the write is slow.
+
+    Args:
+        client: The client to list sessions with
+        session_id: The session ID to wait for
+        timeout: Maximum time to wait in seconds
+
+    Raises:
+        TimeoutError: If the session is not listed within timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        sessions = await client.list_sessions()
+        if any(s.sessionId == session_id for s in sessions):
+            return
+        if loop.time() >= deadline:
+            raise TimeoutError(f"Session {session_id} was not listed within {timeout}s")
+        await asyncio.sleep(0.02)
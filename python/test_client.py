@@ -5,145 +5,182 @@ This file is for unit tests. Where relevant, prefer to add e2e tests in e2e/*.py
 """
 
 import pytest
-
-from copilot import CopilotClient
+import pytest_asyncio
+
+from copilot import (
+    CopilotClient,
+    CopilotSession,
+    InvalidAuthWithCliUrlError,
+    InvalidCliUrlError,
+    InvalidPortError,
+    MutuallyExclusiveOptionsError,
+)
+from copilot.client import _parse_cli_url
 from e2e.testharness import CLI_PATH
 
 
-class TestHandleToolCallRequest:
-    @pytest.mark.asyncio
-    async def test_returns_failure_when_tool_not_registered(self):
-        client = CopilotClient({"cli_path": CLI_PATH})
-        await client.start()
-
-        try:
-            session = await client.create_session()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """A started client shared by the tests in this module that need a CLI process."""
+    client = CopilotClient({"cli_path": CLI_PATH})
+    await client.start()
+    yield client
+    await client.force_stop()
 
-            response = await client._handle_tool_call_request(
-                {
-                    "sessionId": session.session_id,
-                    "toolCallId": "123",
-                    "toolName": "missing_tool",
-                    "arguments": {},
-                }
-            )
 
-            assert response["result"]["resultType"] == "failure"
-            assert response["result"]["error"] == "tool 'missing_tool' not supported"
-        finally:
-            await client.force_stop()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def session(client: CopilotClient):
+    """A session on the shared client, for tests that only need a valid session ID."""
+    return await client.create_session()
 
 
-class TestURLParsing:
-    def test_parse_port_only_url(self):
-        client = CopilotClient({"cli_url": "8080", "log_level": "error"})
-        assert client._actual_port == 8080
-        assert client._actual_host == "localhost"
-        assert client._is_external_server
-
-    def test_parse_host_port_url(self):
-        client = CopilotClient({"cli_url": "127.0.0.1:9000", "log_level": "error"})
-        assert client._actual_port == 9000
-        assert client._actual_host == "127.0.0.1"
-        assert client._is_external_server
-
-    def test_parse_http_url(self):
-        client = CopilotClient({"cli_url": "http://localhost:7000", "log_level": "error"})
-        assert client._actual_port == 7000
-        assert client._actual_host == "localhost"
-        assert client._is_external_server
-
-    def test_parse_https_url(self):
-        client = CopilotClient({"cli_url": "https://example.com:443", "log_level": "error"})
-        assert client._actual_port == 443
-        assert client._actual_host == "example.com"
-        assert client._is_external_server
-
-    def test_invalid_url_format(self):
-        with pytest.raises(ValueError, match="Invalid cli_url format"):
-            CopilotClient({"cli_url": "invalid-url", "log_level": "error"})
-
-    def test_invalid_port_too_high(self):
-        with pytest.raises(ValueError, match="Invalid port in cli_url"):
-            CopilotClient({"cli_url": "localhost:99999", "log_level": "error"})
-
-    def test_invalid_port_zero(self):
-        with pytest.raises(ValueError, match="Invalid port in cli_url"):
-            CopilotClient({"cli_url": "localhost:0", "log_level": "error"})
-
-    def test_invalid_port_negative(self):
-        with pytest.raises(ValueError, match="Invalid port in cli_url"):
-            CopilotClient({"cli_url": "localhost:-1", "log_level": "error"})
-
-    def test_cli_url_with_use_stdio(self):
-        with pytest.raises(ValueError, match="cli_url is mutually exclusive"):
-            CopilotClient({"cli_url": "localhost:8080", "use_stdio": True, "log_level": "error"})
-
-    def test_cli_url_with_cli_path(self):
-        with pytest.raises(ValueError, match="cli_url is mutually exclusive"):
-            CopilotClient(
-                {"cli_url": "localhost:8080", "cli_path": "/path/to/cli", "log_level": "error"}
-            )
-
-    def test_use_stdio_false_when_cli_url(self):
-        client = CopilotClient({"cli_url": "8080", "log_level": "error"})
-        assert not client.options["use_stdio"]
-
-    def test_is_external_server_true(self):
-        client = CopilotClient({"cli_url": "localhost:8080", "log_level": "error"})
-        assert client._is_external_server
+@pytest.fixture(scope="module")
+def make_opts():
+    """Build client options on top of the defaults shared by the constructor tests."""
+    base = {"log_level": "error"}
+    return lambda **overrides: {**base, **overrides}
 
 
-class TestAuthOptions:
-    def test_accepts_github_token(self):
-        client = CopilotClient(
-            {"cli_path": CLI_PATH, "github_token": "gho_test_token", "log_level": "error"}
+class TestHandleToolCallRequest:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_returns_failure_when_tool_not_registered(
+        self, client: CopilotClient, session: CopilotSession
+    ):
+        response = await client._handle_tool_call_request(
+            {
+                "sessionId": session.session_id,
+                "toolCallId": "123",
+                "toolName": "missing_tool",
+                "arguments": {},
+            }
         )
-        assert client.options.get("github_token") == "gho_test_token"
 
-    def test_default_use_logged_in_user_true_without_token(self):
-        client = CopilotClient({"cli_path": CLI_PATH, "log_level": "error"})
-        assert client.options.get("use_logged_in_user") is True
+        assert response["result"]["resultType"] == "failure"
+        assert response["result"]["error"] == "tool 'missing_tool' not supported"
+
+
+class TestURLParsing:
+    @pytest.mark.parametrize(
+        "url,port,host",
+        [
+            ("8080", 8080, "localhost"),
+            ("127.0.0.1:9000", 9000, "127.0.0.1"),
+            ("http://localhost:7000", 7000, "localhost"),
+            ("https://example.com:443", 443, "example.com"),
+        ],
+        ids=["port_only", "host_port", "http", "https"],
+    )
+    def test_parse_valid_url(self, url, port, host):
+        assert _parse_cli_url(url) == (host, port)
+
+    @pytest.mark.parametrize(
+        "url,error",
+        [
+            ("invalid-url", InvalidCliUrlError),
+            ("localhost:99999", InvalidPortError),
+            ("localhost:0", InvalidPortError),
+            ("localhost:-1", InvalidPortError),
+        ],
+        ids=["invalid_format", "port_too_high", "port_zero", "port_negative"],
+    )
+    def test_parse_invalid_url(self, url, error):
+        with pytest.raises(error) as exc_info:
+            _parse_cli_url(url)
+        # InvalidPortError subclasses InvalidCliUrlError, so check the exact type
+        assert exc_info.type is error
+
+    def test_cli_url_with_use_stdio(self, make_opts):
+        with pytest.raises(MutuallyExclusiveOptionsError):
+            CopilotClient(make_opts(cli_url="localhost:8080", use_stdio=True))
+
+    def test_cli_url_with_cli_path(self, make_opts):
+        with pytest.raises(MutuallyExclusiveOptionsError):
+            CopilotClient(make_opts(cli_url="localhost:8080", cli_path="/path/to/cli"))
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("8080", {"host": "localhost", "port": 8080}),
+            ("localhost:8080", {"host": "localhost", "port": 8080}),
+            ("https://example.com:443", {"host": "example.com", "port": 443}),
+        ],
+        ids=["port_only", "host_port", "https"],
+    )
+    def test_client_uses_external_server_for_cli_url(self, make_opts, url, expected):
+        client = CopilotClient(make_opts(cli_url=url))
+        assert {
+            "host": client._actual_host,
+            "port": client._actual_port,
+            "is_external": client._is_external_server,
+            "use_stdio": client.options["use_stdio"],
+        } == {**expected, "is_external": True, "use_stdio": False}
 
-    def test_default_use_logged_in_user_false_with_token(self):
-        client = CopilotClient(
-            {"cli_path": CLI_PATH, "github_token": "gho_test_token", "log_level": "error"}
-        )
-        assert client.options.get("use_logged_in_user") is False
 
-    def test_explicit_use_logged_in_user_true_with_token(self):
-        client = CopilotClient(
+class TestAuthOptions:
+    @pytest.mark.parametrize(
+        "opts,key,expected",
+        [
+            ({"github_token": "gho_test_token"}, "github_token", "gho_test_token"),
+            ({}, "use_logged_in_user", True),
+            ({"github_token": "gho_test_token"}, "use_logged_in_user", False),
+            (
+                {"github_token": "gho_test_token", "use_logged_in_user": True},
+                "use_logged_in_user",
+                True,
+            ),
+            ({"use_logged_in_user": False}, "use_logged_in_user", False),
+        ],
+        ids=[
+            "accepts_github_token",
+            "default_use_logged_in_user_true_without_token",
+            "default_use_logged_in_user_false_with_token",
+            "explicit_use_logged_in_user_true_with_token",
+            "explicit_use_logged_in_user_false_without_token",
+        ],
+    )
+    def test_auth_option(self, make_opts, opts, key, expected):
+        client = CopilotClient(make_opts(cli_path=CLI_PATH, **opts))
+        value = client.options.get(key)
+        assert value == expected
+        # Keep the old `is True` / `is False` strictness for the boolean cases
+        assert type(value) is type(expected)
+
+    @pytest.mark.parametrize(
+        "opts",
+        [{"github_token": "gho_test_token"}, {"use_logged_in_user": False}],
+        ids=["github_token", "use_logged_in_user"],
+    )
+    def test_auth_option_with_cli_url_raises(self, make_opts, opts):
+        with pytest.raises(InvalidAuthWithCliUrlError):
+            CopilotClient(make_opts(cli_url="localhost:8080", **opts))
+
+
+class TestLifecycleDispatch:
+    def test_dispatches_typed_and_wildcard_handlers(self, make_opts):
+        client = CopilotClient(make_opts(cli_url="8080"))
+        typed_events = []
+        all_events = []
+        client.on("session.created", typed_events.append)
+        client.on(all_events.append)
+
+        client._dispatch_lifecycle_event(
             {
-                "cli_path": CLI_PATH,
-                "github_token": "gho_test_token",
-                "use_logged_in_user": True,
-                "log_level": "error",
+                "type": "session.created",
+                "sessionId": "session-1",
+                "metadata": {"startTime": "start", "modifiedTime": "modified"},
             }
         )
-        assert client.options.get("use_logged_in_user") is True
+        client._dispatch_lifecycle_event({"type": "session.deleted", "sessionId": "session-2"})
 
-    def test_explicit_use_logged_in_user_false_without_token(self):
-        client = CopilotClient(
-            {"cli_path": CLI_PATH, "use_logged_in_user": False, "log_level": "error"}
-        )
-        assert client.options.get("use_logged_in_user") is False
-
-    def test_github_token_with_cli_url_raises(self):
-        with pytest.raises(
-            ValueError, match="github_token and use_logged_in_user cannot be used with cli_url"
-        ):
-            CopilotClient(
-                {
-                    "cli_url": "localhost:8080",
-                    "github_token": "gho_test_token",
-                    "log_level": "error",
-                }
-            )
-
-    def test_use_logged_in_user_with_cli_url_raises(self):
-        with pytest.raises(
-            ValueError, match="github_token and use_logged_in_user cannot be used with cli_url"
-        ):
-            CopilotClient(
-                {"cli_url": "localhost:8080", "use_logged_in_user": False, "log_level": "error"}
-            )
+        assert [e.sessionId for e in typed_events] == ["session-1"]
+        assert typed_events[0].metadata is not None
+        assert typed_events[0].metadata.startTime == "start"
+        assert [e.type for e in all_events] == ["session.created", "session.deleted"]
+
+    def test_ignores_events_without_subscribers(self, make_opts):
+        client = CopilotClient(make_opts(cli_url="8080"))
+        unsubscribe = client.on("session.created", lambda e: None)
+        unsubscribe()
+
+        # No handlers remain, so the notification is dropped without error
+        client._dispatch_lifecycle_event({"type": "session.created", "sessionId": "session-1"})
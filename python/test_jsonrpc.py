@@ -5,6 +5,7 @@ Tests for the JSON-RPC client implementation, focusing on proper handling
 of large payloads and short reads from pipes.
 """
 
+import asyncio
 import io
 import json
 
@@ -265,3 +266,55 @@ class TestReadMessageWithLargePayloads:
 
         result2 = client._read_message()
         assert result2 == message2
+
+
+class TestSendMessage:
+    """Tests for _send_message() framing"""
+
+    @pytest.mark.asyncio
+    async def test_send_message_round_trips_through_read_message(self):
+        """Test that a written frame can be read back, including non-ASCII content"""
+        message = {"jsonrpc": "2.0", "id": "1", "method": "ping", "params": {"message": "héllo ✓"}}
+
+        process = MockProcess()
+        client = JsonRpcClient(process)
+        await client._send_message(message)
+
+        written = process.stdin.getvalue()
+        assert written.startswith(b"Content-Length: ")
+
+        process.stdout = ShortReadStream(written, chunk_size=8)
+        assert client._read_message() == message
+
+
+class TestHandleMessage:
+    """Tests for routing incoming messages"""
+
+    def test_incoming_request_does_not_resolve_pending_request_with_same_id(self):
+        """Test that a server request reusing one of our ids is not treated as a response"""
+        loop = asyncio.new_event_loop()
+        try:
+            client = JsonRpcClient(MockProcess())
+            future = loop.create_future()
+            client.pending_requests["1"] = future
+
+            client._handle_message({"jsonrpc": "2.0", "id": "1", "method": "tool.call"})
+            loop.run_until_complete(asyncio.sleep(0))
+
+            assert not future.done()
+        finally:
+            loop.close()
+
+    def test_response_resolves_pending_request(self):
+        """Test that a response is routed to the pending request with its id"""
+        loop = asyncio.new_event_loop()
+        try:
+            client = JsonRpcClient(MockProcess())
+            future = loop.create_future()
+            client.pending_requests["1"] = future
+
+            client._handle_message({"jsonrpc": "2.0", "id": "1", "result": {"ok": True}})
+
+            assert loop.run_until_complete(future) == {"ok": True}
+        finally:
+            loop.close()